@@ -1,19 +1,113 @@
 from __future__ import annotations
 
 from fractions import Fraction
-from itertools import accumulate
+from functools import lru_cache
+from math import gcd, lcm
+from operator import attrgetter
 from typing import TYPE_CHECKING, Iterable, Sequence, cast
 
 from typing_extensions import Literal
 
 from textual.box_model import BoxModel
-from textual.css.scalar import Scalar
+from textual.css.scalar import Scalar, Unit
 from textual.css.styles import RenderStyles
 from textual.geometry import Size
 
 if TYPE_CHECKING:
     from textual.widget import Widget
 
+_FRACTION_ZERO = Fraction(0)
+_FRACTION_ONE = Fraction(1)
+
+
+def _rescale(
+    widths: list[int], numerator: int, denominator: int
+) -> tuple[list[int], int]:
+    """Multiply widths by `numerator / denominator`, keeping them as integers.
+
+    Args:
+        widths: Widths, as numerators over a common scale.
+        numerator: Numerator of the multiplier.
+        denominator: Denominator of the multiplier.
+
+    Returns:
+        A tuple of the new widths and the new (positive) scale.
+    """
+    # Reduce once per rescale, so that integers stay small over many rescales
+    divisor = gcd(numerator, denominator)
+    if denominator < 0:
+        divisor = -divisor
+    numerator //= divisor
+    denominator //= divisor
+    if numerator == 1:
+        return widths, denominator
+    return [width * numerator for width in widths], denominator
+
+
+def _expand_shrink(
+    widths: list[int],
+    scale: int,
+    total_space: int,
+    expand: bool,
+    shrink: bool,
+    minimums: Sequence[int] | None,
+) -> tuple[list[int], int]:
+    """Expand or shrink widths to fit the total space.
+
+    Args:
+        widths: Widths, as numerators over `scale`.
+        scale: Common denominator of the widths.
+        total_space: Space to fit widths in to.
+        expand: Expand widths to fill the total space?
+        shrink: Shrink widths to fit the total space?
+        minimums: Minimum widths (in cells) when shrinking, or `None` for no minimums.
+
+    Returns:
+        A tuple of the new widths and the new scale.
+    """
+    used_space = sum(widths)
+    available_space = total_space * scale
+    if expand:
+        if available_space > used_space and used_space:
+            # Each width grows in proportion to total_space / used_space
+            widths, scale = _rescale(widths, total_space, used_space)
+            used_space = available_space = sum(widths)
+    if shrink:
+        excess_space = used_space - available_space
+        if minimums is not None and excess_space > 0:
+            for index, (minimum_width, width) in enumerate(zip(minimums, widths)):
+                if (width - used_space) * used_space > 0:
+                    # Width exceeds used space; rescale so that removing
+                    # width / used_space of the excess stays exact.
+                    sign = 1 if used_space > 0 else -1
+                    remove_space = width * excess_space * sign
+                    factor = used_space * sign
+                    widths[:] = [value * factor for value in widths]
+                    width *= factor
+                    used_space *= factor
+                    available_space *= factor
+                    scale *= factor
+                else:
+                    remove_space = excess_space
+                updated_width = width - remove_space
+                minimum_width *= scale
+                if updated_width < minimum_width:
+                    updated_width = minimum_width
+                widths[index] = updated_width
+                used_space += updated_width - width
+                excess_space = used_space - available_space
+                if excess_space <= 0:
+                    break
+
+            used_space = sum(widths)
+            excess_space = used_space - available_space
+
+        if excess_space > 0 and used_space:
+            # Each width shrinks in proportion to total_space / used_space
+            widths, scale = _rescale(widths, total_space, used_space)
+
+    return widths, scale
+
 
 def resolve(
     dimensions: Sequence[Scalar],
@@ -34,88 +128,128 @@ def resolve(
         gutter: Gutter between rows / columns.
         size: Size of container.
         viewport: Size of viewport.
+        expand: Expand dimensions to fill the total space?
+        shrink: Shrink dimensions to fit the total space?
+        minimums: Minimum sizes when shrinking, or `None` for no minimums.
 
     Returns:
         List of (<OFFSET>, <LENGTH>)
     """
-    resolved: list[tuple[Scalar, Fraction | None]] = [
-        (
-            (scalar, None)
-            if scalar.is_fraction
-            else (scalar, scalar.resolve(size, viewport))
+    return list(
+        _resolve(
+            tuple(dimensions),
+            total,
+            gutter,
+            size,
+            viewport,
+            expand,
+            shrink,
+            None if minimums is None else tuple(minimums),
         )
-        for scalar in dimensions
-    ]
-
-    from_float = Fraction.from_float
-    total_fraction = from_float(
-        sum([scalar.value for scalar, fraction in resolved if fraction is None])
     )
 
+
+@lru_cache(maxsize=1024)
+def _resolve(
+    dimensions: tuple[Scalar, ...],
+    total: int,
+    gutter: int,
+    size: Size,
+    viewport: Size,
+    expand: bool,
+    shrink: bool,
+    minimums: tuple[int, ...] | None,
+) -> tuple[tuple[int, int], ...]:
+    """Resolve a tuple of dimensions (results are cached).
+
+    Args:
+        dimensions: Scalars for column / row sizes.
+        total: Total space to divide.
+        gutter: Gutter between rows / columns.
+        size: Size of container.
+        viewport: Size of viewport.
+        expand: Expand dimensions to fill the total space?
+        shrink: Shrink dimensions to fit the total space?
+        minimums: Minimum sizes when shrinking, or `None` for no minimums.
+
+    Returns:
+        Tuple of (<OFFSET>, <LENGTH>)
+    """
+    # Flatten each scalar to (<IS FRACTION>, <NUMERATOR>, <DENOMINATOR>).
+    # Fr values are floats, so their ratios are available without a Fraction.
+    tracks: list[tuple[bool, int, int]] = []
+    fraction_value = 0.0
+    add_track = tracks.append
+    for scalar in dimensions:
+        value, unit, _ = scalar
+        if unit == Unit.FRACTION:
+            fraction_value += value
+            add_track((True, *value.as_integer_ratio()))
+        else:
+            fraction = scalar.resolve(size, viewport)
+            add_track((False, fraction.numerator, fraction.denominator))
+
+    if not (expand or shrink) and all(
+        not is_fraction and denominator == 1 for is_fraction, _, denominator in tracks
+    ):
+        # No fr units and only whole cells, so lengths may be used as they are
+        results: list[tuple[int, int]] = []
+        offset = 0
+        for _, length, _ in tracks:
+            results.append((offset, length))
+            offset += length + gutter
+        return tuple(results)
+
+    # All arithmetic below is done with integers, as numerators over a common
+    # denominator (`scale`), which avoids the overhead of Fraction operations.
+    fraction_numerator, fraction_denominator = fraction_value.as_integer_ratio()
+    scale = lcm(fraction_denominator, *[denominator for _, _, denominator in tracks])
+    widths = [
+        numerator * (scale // denominator) for _, numerator, denominator in tracks
+    ]
+
     total_gutter = gutter * (len(dimensions) - 1)
-    if total_fraction:
-        consumed = sum([fraction for _, fraction in resolved if fraction is not None])
-        remaining = max(Fraction(0), Fraction(total - total_gutter) - consumed)
-        fraction_unit = Fraction(remaining, total_fraction)
-        resolved_fractions = [
-            from_float(scalar.value) * fraction_unit if fraction is None else fraction
-            for scalar, fraction in resolved
-        ]
-    else:
-        resolved_fractions = cast(
-            "list[Fraction]", [fraction for _, fraction in resolved]
+    total_space = total - total_gutter
+    if fraction_numerator:
+        fraction_total = fraction_numerator * (scale // fraction_denominator)
+        consumed = sum(
+            width
+            for width, (is_fraction, _, _) in zip(widths, tracks)
+            if not is_fraction
         )
-
-    fraction_gutter = Fraction(gutter)
+        remaining = max(0, total_space * scale - consumed)
+        if fraction_total < 0:
+            # Keep the scale positive, so that flooring is correct
+            fraction_total, remaining = -fraction_total, -remaining
+        # 1fr is remaining / fraction_total, so rescale to keep widths integral
+        widths = [
+            width * (remaining if is_fraction else fraction_total)
+            for width, (is_fraction, _, _) in zip(widths, tracks)
+        ]
+        scale *= fraction_total
 
     if expand or shrink:
-        total_space = total - total_gutter
-        used_space = sum(resolved_fractions)
-        if expand:
-            remaining_space = total_space - used_space
-            if remaining_space > 0:
-                resolved_fractions = [
-                    width + Fraction(width, used_space) * remaining_space
-                    for width in resolved_fractions
-                ]
-        if shrink:
-            one = Fraction(1)
-            excess_space = used_space - total_space
-            if minimums is not None and excess_space > 0:
-                for index, (minimum_width, width) in enumerate(
-                    zip(map(Fraction, minimums), resolved_fractions)
-                ):
-                    remove_space = max(Fraction(width, used_space), one) * excess_space
-                    updated_width = max(minimum_width, width - remove_space)
-                    resolved_fractions[index] = updated_width
-                    used_space = used_space - width + updated_width
-                    excess_space = used_space - total_space
-                    if excess_space <= 0:
-                        break
-
-                used_space = sum(resolved_fractions)
-                excess_space = used_space - total_space
-
-            if excess_space > 0:
-                resolved_fractions = [
-                    width - Fraction(width, used_space) * excess_space
-                    for width in resolved_fractions
-                ]
-
-    offsets = [0] + [
-        fraction.__floor__()
-        for fraction in accumulate(
-            value
-            for fraction in resolved_fractions
-            for value in (fraction, fraction_gutter)
+        widths, scale = _expand_shrink(
+            widths, scale, total_space, expand, shrink, minimums
         )
-    ]
-    results = [
-        (offset1, offset2 - offset1)
-        for offset1, offset2 in zip(offsets[::2], offsets[1::2])
-    ]
 
-    return results
+    results = []
+    position = 0
+    if scale == 1:
+        # Widths are whole cells, so there is nothing to floor
+        for width in widths:
+            results.append((position, width))
+            position += width + gutter
+        return tuple(results)
+
+    scaled_gutter = gutter * scale
+    for width in widths:
+        start = position // scale
+        position += width
+        results.append((start, position // scale - start))
+        position += scaled_gutter
+
+    return tuple(results)
 
 
 def resolve_fraction_unit(
@@ -139,12 +273,12 @@ def resolve_fraction_unit(
     """
     _Fraction = Fraction
     if not remaining_space or not widget_styles:
-        return _Fraction(1)
+        return _FRACTION_ONE
 
     initial_space = remaining_space
 
     def resolve_scalar(
-        scalar: Scalar | None, fraction_unit: Fraction = Fraction(1)
+        scalar: Scalar | None, fraction_unit: Fraction = _FRACTION_ONE
     ) -> Fraction | None:
         """Resolve a scalar if it is not None.
 
@@ -161,57 +295,123 @@ def resolve_fraction_unit(
             else scalar.resolve(size, viewport_size, fraction_unit)
         )
 
-    resolve: list[tuple[Scalar, Fraction | None, Fraction | None]] = []
+    get_styles = (
+        attrgetter("width", "min_width", "max_width", "overlay")
+        if resolve_dimension == "width"
+        else attrgetter("height", "min_height", "max_height", "overlay")
+    )
 
-    if resolve_dimension == "width":
-        resolve = [
-            (
-                cast(Scalar, styles.width),
-                resolve_scalar(styles.min_width),
-                resolve_scalar(styles.max_width),
-            )
-            for styles in widget_styles
-            if styles.overlay != "screen"
-        ]
-    else:
-        resolve = [
-            (
-                cast(Scalar, styles.height),
-                resolve_scalar(styles.min_height),
-                resolve_scalar(styles.max_height),
-            )
-            for styles in widget_styles
-            if styles.overlay != "screen"
+    # Per-widget data is held in parallel lists, indexed by widget.
+    # A fr scalar resolves to its value multiplied by the fraction unit, and any
+    # other scalar doesn't depend on the fraction unit, so neither needs to be
+    # re-resolved on each iteration.
+    values: list[Fraction] = []
+    fixed_values: list[Fraction | None] = []
+    min_values: list[Fraction | None] = []
+    max_values: list[Fraction | None] = []
+    total_value = 0.0
+    for styles in widget_styles:
+        scalar, min_scalar, max_scalar, overlay = get_styles(styles)
+        if overlay == "screen":
+            continue
+        scalar = cast(Scalar, scalar)
+        total_value += scalar.value
+        values.append(_Fraction(scalar.value))
+        fixed_values.append(
+            None if scalar.is_fraction else scalar.resolve(size, viewport_size)
+        )
+        min_values.append(resolve_scalar(min_scalar))
+        max_values.append(resolve_scalar(max_scalar))
+
+    if len(values) == 1:
+        # A single widget has all the space, unless it is clamped
+        (fraction,) = values
+        if fraction <= 0:
+            return initial_space
+        fixed, minimum, maximum = fixed_values[0], min_values[0], max_values[0]
+        size_value = remaining_space if fixed is None else fixed
+        if (minimum is not None and size_value < minimum) or (
+            maximum is not None and size_value > maximum
+        ):
+            return initial_space
+        return remaining_space / fraction
+
+    # The loop below works with integers, as numerators over a common
+    # denominator, to avoid the overhead of Fraction operations.
+    total_fraction = _Fraction(total_value)
+    scale = lcm(
+        remaining_space.denominator,
+        total_fraction.denominator,
+        *[
+            value.denominator
+            for value in (*values, *fixed_values, *min_values, *max_values)
+            if value is not None
+        ],
+    )
+
+    def scale_values(fractions: Sequence[Fraction | None]) -> list[int | None]:
+        """Scale Fractions to numerators over the common denominator.
+
+        Args:
+            fractions: Fractions or Nones.
+
+        Returns:
+            Numerators, or None where the fraction is None.
+        """
+        return [
+            None if value is None else value.numerator * (scale // value.denominator)
+            for value in fractions
         ]
 
-    resolved: list[Fraction | None] = [None] * len(resolve)
-    remaining_fraction = Fraction(sum(scalar.value for scalar, _, _ in resolve))
+    fraction_values = cast("list[int]", scale_values(values))
+    fixed_numerators = scale_values(fixed_values)
+    min_numerators = scale_values(min_values)
+    max_numerators = scale_values(max_values)
+    space = remaining_space.numerator * (scale // remaining_space.denominator)
+    remaining_fraction = total_fraction.numerator * (
+        scale // total_fraction.denominator
+    )
+
+    count = len(values)
+    resolved = [False] * count
 
     while remaining_fraction > 0:
         remaining_space_changed = False
-        resolve_fraction = _Fraction(remaining_space, remaining_fraction)
-        for index, (scalar, min_value, max_value) in enumerate(resolve):
-            value = resolved[index]
-            if value is None:
-                resolved_scalar = scalar.resolve(size, viewport_size, resolve_fraction)
-                if min_value is not None and resolved_scalar < min_value:
-                    remaining_space -= min_value
-                    remaining_fraction -= _Fraction(scalar.value)
-                    resolved[index] = min_value
+        # 1fr is unit_space / unit_fraction (Scalar.resolve treats zero as 1).
+        # Comparisons are multiplied through by unit_fraction.
+        unit_space, unit_fraction = (space, remaining_fraction) if space else (1, 1)
+        for index in range(count):
+            if not resolved[index]:
+                fixed_value = fixed_numerators[index]
+                resolved_scalar = (
+                    fraction_values[index] * unit_space
+                    if fixed_value is None
+                    else fixed_value * unit_fraction
+                )
+                min_value = min_numerators[index]
+                max_value = max_numerators[index]
+                if (
+                    min_value is not None
+                    and resolved_scalar < min_value * unit_fraction
+                ):
+                    space -= min_value
+                    remaining_fraction -= fraction_values[index]
+                    resolved[index] = True
                     remaining_space_changed = True
-                elif max_value is not None and resolved_scalar > max_value:
-                    remaining_space -= max_value
-                    remaining_fraction -= _Fraction(scalar.value)
-                    resolved[index] = max_value
+                elif (
+                    max_value is not None
+                    and resolved_scalar > max_value * unit_fraction
+                ):
+                    space -= max_value
+                    remaining_fraction -= fraction_values[index]
+                    resolved[index] = True
                     remaining_space_changed = True
 
         if not remaining_space_changed:
             break
 
     return (
-        Fraction(remaining_space, remaining_fraction)
-        if remaining_fraction > 0
-        else initial_space
+        Fraction(space, remaining_fraction) if remaining_fraction > 0 else initial_space
     )
 
 
@@ -241,63 +441,52 @@ def resolve_box_models(
     margin_width, margin_height = margin
     fraction_width = Fraction(size.width)
     fraction_height = Fraction(size.height)
-    fraction_zero = Fraction(0)
+    fraction_zero = _FRACTION_ZERO
     margin_size = size - margin
 
-    margins = [widget.styles.margin.totals for widget in widgets]
-
-    # Fixed box models
-    box_models: list[BoxModel | None] = [
-        (
-            None
-            if _dimension is not None and _dimension.is_fraction
-            else widget._get_box_model(
-                size,
-                viewport_size,
-                (
-                    fraction_zero
-                    if (_width := fraction_width - margin_width) < 0
-                    else _width
-                ),
-                (
-                    fraction_zero
-                    if (_height := fraction_height - margin_height) < 0
-                    else _height
-                ),
-                greedy=greedy,
-            )
-        )
-        for (_dimension, widget, (margin_width, margin_height)) in zip(
-            dimensions, widgets, margins
+    resolve_width = resolve_dimension == "width"
+
+    # Fixed box models, the space they occupy, and the styles of widgets with fr
+    # units, calculated in a single pass.
+    box_models: list[BoxModel | None] = []
+    fraction_styles: list[RenderStyles] = []
+    total_remaining = fraction_zero
+    for dimension, widget in zip(dimensions, widgets):
+        styles = widget.styles
+        in_flow = styles.overlay != "screen"
+        if dimension is not None and dimension.is_fraction:
+            box_models.append(None)
+            if in_flow:
+                fraction_styles.append(styles)
+            continue
+        widget_margin_width, widget_margin_height = styles.margin.totals
+        box_model = widget._get_box_model(
+            size,
+            viewport_size,
+            (
+                fraction_zero
+                if (_width := fraction_width - widget_margin_width) < 0
+                else _width
+            ),
+            (
+                fraction_zero
+                if (_height := fraction_height - widget_margin_height) < 0
+                else _height
+            ),
+            greedy=greedy,
         )
-    ]
+        box_models.append(box_model)
+        if in_flow:
+            total_remaining += box_model.width if resolve_width else box_model.height
 
     if None not in box_models:
         # No fr units, so we're done
         return cast("list[BoxModel]", box_models)
 
-    # If all box models have been calculated
-    widget_styles = [widget.styles for widget in widgets]
-    if resolve_dimension == "width":
-        total_remaining = int(
-            sum(
-                [
-                    box_model.width
-                    for widget, box_model in zip(widgets, box_models)
-                    if (box_model is not None and widget.styles.overlay != "screen")
-                ]
-            )
-        )
-
-        remaining_space = int(max(0, size.width - total_remaining - margin_width))
+    if resolve_width:
+        remaining_space = int(max(0, size.width - int(total_remaining) - margin_width))
         fraction_unit = resolve_fraction_unit(
-            [
-                styles
-                for styles in widget_styles
-                if styles.width is not None
-                and styles.width.is_fraction
-                and styles.overlay != "screen"
-            ],
+            fraction_styles,
             size,
             viewport_size,
             Fraction(remaining_space),
@@ -306,28 +495,11 @@ def resolve_box_models(
         width_fraction = fraction_unit
         height_fraction = Fraction(margin_size.height)
     else:
-        total_remaining = int(
-            sum(
-                [
-                    box_model.height
-                    for widget, box_model in zip(widgets, box_models)
-                    if (box_model is not None and widget.styles.overlay != "screen")
-                ]
-            )
+        remaining_space = int(
+            max(0, size.height - int(total_remaining) - margin_height)
         )
-
-        remaining_space = int(max(0, size.height - total_remaining - margin_height))
-
         fraction_unit = resolve_fraction_unit(
-            [
-                styles
-                for styles in widget_styles
-                if (
-                    styles.height is not None
-                    and styles.height.is_fraction
-                    and styles.overlay != "screen"
-                )
-            ],
+            fraction_styles,
             size,
             viewport_size,
             Fraction(remaining_space),
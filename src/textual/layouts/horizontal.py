@@ -28,8 +28,11 @@ class HorizontalLayout(Layout):
         viewport = parent.app.viewport_size
 
         child_styles = [child.styles for child in children]
+        overlays = [styles.overlay == "screen" for styles in child_styles]
         box_margins: list[Spacing] = [
-            styles.margin for styles in child_styles if styles.overlay != "screen"
+            styles.margin
+            for styles, overlay in zip(child_styles, overlays)
+            if not overlay
         ]
         if box_margins:
             resolve_margin = Size(
@@ -70,8 +73,8 @@ class HorizontalLayout(Layout):
         x = next(
             (
                 Fraction(box_model.margin.left)
-                for box_model, child in zip(box_models, children)
-                if child.styles.overlay != "screen"
+                for box_model, overlay in zip(box_models, overlays)
+                if not overlay
             ),
             Fraction(0),
         )
@@ -79,11 +82,13 @@ class HorizontalLayout(Layout):
         _Region = Region
         _WidgetPlacement = WidgetPlacement
         _Size = Size
-        for widget, (content_width, content_height, box_margin), margin in zip(
-            children, box_models, margins
-        ):
-            styles = widget.styles
-            overlay = styles.overlay == "screen"
+        for (
+            widget,
+            styles,
+            overlay,
+            (content_width, content_height, box_margin),
+            margin,
+        ) in zip(children, child_styles, overlays, box_models, margins):
             offset = (
                 styles.offset.resolve(
                     _Size(content_width.__floor__(), content_height.__floor__()),
@@ -115,6 +115,9 @@ _JUSTIFY_MAP: dict[str, JustifyMethod] = {
 }
 
 
+_FRACTION_ZERO = Fraction(0)
+_AUTO_SCALAR = Scalar.parse("auto")
+
 _MOUSE_EVENTS_DISALLOW_IF_DISABLED = (events.MouseEvent, events.Enter, events.Leave)
 _MOUSE_EVENTS_ALLOW_IF_DISABLED = (
     events.MouseScrollDown,
@@ -1774,7 +1777,7 @@ class Widget(DOMNode):
 
         styles_width = styles.width
         if not greedy and styles_width is not None and styles_width.is_fraction:
-            styles_width = Scalar.parse("auto")
+            styles_width = _AUTO_SCALAR
         is_auto_width = styles_width and styles_width.is_auto
         is_auto_height = styles.height and styles.height.is_auto
 
@@ -1813,7 +1816,7 @@ class Widget(DOMNode):
 
         if min_width is not None:
             # Restrict to minimum width, if set
-            content_width = max(content_width, min_width, Fraction(0))
+            content_width = max(content_width, min_width, _FRACTION_ZERO)
 
         if max_width is not None and not (
             container.width == 0
@@ -1824,7 +1827,7 @@ class Widget(DOMNode):
             # Restrict to maximum width, if set
             content_width = min(content_width, max_width)
 
-        content_width = max(Fraction(0), content_width)
+        content_width = max(_FRACTION_ZERO, content_width)
 
         if constrain_width:
             content_width = min(Fraction(container.width - gutter.width), content_width)
@@ -1861,7 +1864,7 @@ class Widget(DOMNode):
 
         if min_height is not None:
             # Restrict to minimum height, if set
-            content_height = max(content_height, min_height, Fraction(0))
+            content_height = max(content_height, min_height, _FRACTION_ZERO)
 
         if max_height is not None and not (
             container.height == 0
@@ -1871,7 +1874,7 @@ class Widget(DOMNode):
         ):
             content_height = min(content_height, max_height)
 
-        content_height = max(Fraction(0), content_height)
+        content_height = max(_FRACTION_ZERO, content_height)
         model = BoxModel(
             content_width + gutter.width, content_height + gutter.height, margin
         )
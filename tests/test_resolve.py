@@ -61,6 +61,50 @@ def test_resolve(scalars, total, gutter, result):
     )
 
 
+@pytest.mark.parametrize(
+    "scalars,total,gutter,expand,shrink,minimums,result",
+    [
+        (["10", "20"], 60, 0, True, False, None, [(0, 20), (20, 40)]),
+        (["10", "20"], 15, 0, False, True, None, [(0, 5), (5, 10)]),
+        (["10", "20"], 15, 1, False, True, [8, 1], [(0, 8), (9, 6)]),
+        (
+            ["20", "20", "20"],
+            30,
+            0,
+            False,
+            True,
+            [15, 5, 5],
+            [(0, 15), (15, 5), (20, 10)],
+        ),
+        (
+            ["33.3%", "1fr", "2.5"],
+            50,
+            1,
+            False,
+            False,
+            None,
+            [(0, 13), (14, 32), (47, 3)],
+        ),
+    ],
+)
+def test_resolve_expand_shrink(
+    scalars, total, gutter, expand, shrink, minimums, result
+):
+    assert (
+        resolve(
+            [Scalar.parse(scalar) for scalar in scalars],
+            total,
+            gutter,
+            Size(40, 20),
+            Size(80, 24),
+            expand=expand,
+            shrink=shrink,
+            minimums=minimums,
+        )
+        == result
+    )
+
+
 async def test_resolve_fraction_unit():
     """Test resolving fraction units in combination with minimum widths."""
     widget1 = Widget()
@@ -166,3 +210,22 @@ async def test_resolve_issue_2502():
         ),
         Fraction,
     )
+
+
+async def test_resolve_fraction_unit_single_widget():
+    """A single widget gets all the space, or the initial space if clamped."""
+    widget = Widget()
+    widget.styles.width = "2fr"
+    styles = (widget.styles,)
+
+    def resolve_width(remaining_space: int) -> Fraction:
+        return resolve_fraction_unit(
+            styles, Size(80, 24), Size(80, 24), Fraction(remaining_space)
+        )
+
+    assert resolve_width(30) == Fraction(15)
+    widget.styles.max_width = 10
+    assert resolve_width(30) == Fraction(30)
+    widget.styles.max_width = None
+    widget.styles.min_width = 40
+    assert resolve_width(30) == Fraction(30)